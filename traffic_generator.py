@@ -8,19 +8,28 @@ including LLMs, embeddings, rerankers, VLMs, and more.
 """
 
 import argparse
+import asyncio
 import base64
 import json
 import logging
 import os
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Coroutine, Tuple, Union
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import caiiclient
 import httpx
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
+
+try:
+    import uvloop
+except ImportError:  # Optional, fall back to the default asyncio event loop
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +39,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def run_event_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on uvloop if it is installed, otherwise on asyncio"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 @dataclass
 class EndpointInfo:
     """Information about a model endpoint"""
@@ -38,9 +54,10 @@ class EndpointInfo:
     url: str
     state: str
     api_standard: str
-    task: str
+    task: str  # Upper-cased at discovery time
     model_name: str
     has_chat_template: bool
+    base_url: str  # OpenAI-compatible base URL, url without the /v1/... part
 
 
 class TrafficGenerator:
@@ -100,9 +117,44 @@ class TrafficGenerator:
 
     # Placeholder base64 image (1x1 red pixel PNG)
     PLACEHOLDER_IMAGE = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8DwHwAFBQIAX8jx0gAAAABJRU5ErkJggg=="
+    PLACEHOLDER_IMAGE_URL = f"data:image/png;base64,{PLACEHOLDER_IMAGE}"
+
+    # Maximum number of endpoint requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 16
+
+    # Minimum seconds between request starts to the same serving host
+    HOST_MIN_GAP = 2.0
+
+    # Traffic generator method for each (upper-case) endpoint task
+    _TASK_DISPATCH = {
+        "TEXT_GENERATION": "_generate_text_traffic",
+        "TEXT_TO_TEXT_GENERATION": "_generate_text_traffic",
+        "EMBED": "_generate_embedding_traffic",
+        "RANK": "_generate_rerank_traffic",
+        "IMAGE_TEXT_TO_TEXT": "_generate_vlm_traffic",
+        # OBJECT_DETECTION endpoints may use chat completions format
+        "OBJECT_DETECTION": "_generate_vlm_traffic",
+    }
+
+    # Tasks that are skipped (counted as successful), with the reason why
+    _TASK_SKIP = {
+        "SPEECH_TO_TEXT": "requires audio file",
+        "TEXT_TO_SPEECH": "requires specific setup",
+        # Generic INFERENCE endpoints - skip as format is unknown
+        "INFERENCE": "generic inference format",
+    }
+
+    # Rerank request formats, tried in this order unless one is known to work
+    RERANK_FORMATS = ("nim", "openai")
+
+    # Maximum number of namespaces discovered in parallel
+    MAX_DISCOVERY_WORKERS = 8
+
+    # Consecutive failures of one endpoint before the discovery cache is dropped
+    DISCOVERY_INVALIDATE_FAILURES = 3
 
     def __init__(self, cdp_token: str, domain: str, verify_ssl: bool = True,
-                 interval: int = 60, max_tokens: int = 50):
+                 interval: int = 60, max_tokens: int = 50, keepalive_mode: bool = False):
         """
         Initialize the traffic generator
         
@@ -112,6 +164,8 @@ class TrafficGenerator:
             verify_ssl: Whether to verify SSL certificates
             interval: Seconds between traffic generation cycles
             max_tokens: Maximum tokens to generate for LLM requests
+            keepalive_mode: Request a single token from LLMs/VLMs and discard
+                response bodies without parsing them
         """
         self.cdp_token = cdp_token
         
@@ -129,6 +183,17 @@ class TrafficGenerator:
         self.verify_ssl = verify_ssl
         self.interval = interval
         self.max_tokens = max_tokens
+        self.keepalive_mode = keepalive_mode
+
+        # Tokens actually requested from text and vision models
+        self._completion_max_tokens = 1 if keepalive_mode else max_tokens
+
+        # Reuse discovery results for several cycles, the endpoint list rarely changes
+        self.discovery_ttl = max(interval * 5, 300)
+        # (discovery time, endpoints) keyed by namespace
+        self._discovery_cache: Dict[str, Tuple[float, List[EndpointInfo]]] = {}
+        # Consecutive traffic failures keyed by endpoint URL (names are only unique per namespace)
+        self._endpoint_failures: Dict[str, int] = {}
         
         # Setup API client for discovery
         config = caiiclient.Configuration()
@@ -143,13 +208,93 @@ class TrafficGenerator:
 
         self.serving_api = caiiclient.ServingApi(api_client=api_client)
 
-        # Setup HTTP client for requests
-        if verify_ssl:
-            self.http_client = httpx.Client(timeout=30.0)
-        else:
-            self.http_client = httpx.Client(verify=False, timeout=30.0)
+        # listEndpoints request objects, reused across cycles, keyed by namespace
+        self._list_requests: Dict[str, caiiclient.ServingListEndpointsRequest] = {}
+
+        # Setup async HTTP client for requests, shared by all endpoints.
+        # HTTP/2 lets concurrent requests to the same serving host share one connection
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            verify=verify_ssl,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=128,
+                keepalive_expiry=120,
+            ),
+        )
+
+        # OpenAI clients keyed by base URL, reused across cycles
+        self._openai_clients: Dict[str, AsyncOpenAI] = {}
+
+        # Private RNG for sample selection, independent of the global random state
+        self._rng = random.Random()
+
+        # Headers for raw JSON requests (embeddings, rerank)
+        self._json_headers = {
+            "Authorization": f"Bearer {cdp_token}",
+            "Content-Type": "application/json",
+        }
+
+        # Serialized request bodies, built once per model on first use
+        self._embedding_payloads: Dict[str, bytes] = {}
+        self._rerank_payloads: Dict[Tuple[str, str], List[bytes]] = {}
 
-    def discover_endpoints(self, namespace: str = "serving-default") -> List[EndpointInfo]:
+        # Per-host spacing of requests, keyed by host name
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last_send: Dict[str, float] = {}
+
+        # Embedding dimension keyed by endpoint URL, learned from its first response
+        self._embedding_dims: Dict[str, int] = {}
+
+        # Rerank format that last succeeded, keyed by endpoint URL
+        self._rerank_format_cache: Dict[str, str] = {}
+
+        # VLM messages never change, so build them once up front
+        self._vlm_parse_messages = self._build_vlm_messages()
+        self._vlm_messages = {
+            prompt: self._build_vlm_messages(prompt) for prompt in self.VLM_PROMPTS
+        }
+
+    @classmethod
+    def _build_vlm_messages(cls, prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Build chat messages for a VLM request around the placeholder image
+
+        Args:
+            prompt: Text prompt to send alongside the image, or None for image-only
+
+        Returns:
+            List of chat messages
+        """
+        content: List[Dict[str, Any]] = [
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": cls.PLACEHOLDER_IMAGE_URL
+                }
+            }
+        ]
+        if prompt is not None:
+            content.append({
+                "type": "text",
+                "text": prompt
+            })
+        return [{"role": "user", "content": content}]
+
+    def _get_openai_client(self, base_url: str) -> AsyncOpenAI:
+        """Return the cached OpenAI client for a base URL, creating it on first use"""
+        client = self._openai_clients.get(base_url)
+        if client is None:
+            client = AsyncOpenAI(
+                base_url=base_url,
+                api_key=self.cdp_token,
+                http_client=self.http_client,
+            )
+            self._openai_clients[base_url] = client
+        return client
+
+    def discover_endpoints(self, namespace: str = "serving-default") -> Optional[List[EndpointInfo]]:
         """
         Discover all available endpoints in the namespace
 
@@ -157,41 +302,85 @@ class TrafficGenerator:
             namespace: Kubernetes namespace to query
 
         Returns:
-            List of EndpointInfo objects
+            List of EndpointInfo objects, or None if the listEndpoints call failed
         """
-        logger.info(f"Discovering endpoints in namespace: {namespace}")
+        logger.info("Discovering endpoints in namespace: %s", namespace)
 
         try:
-            req = caiiclient.ServingListEndpointsRequest(namespace=namespace)
+            req = self._list_requests.get(namespace)
+            if req is None:
+                req = caiiclient.ServingListEndpointsRequest(namespace=namespace)
+                self._list_requests[namespace] = req
             response = self.serving_api.serving_list_endpoints(req)
 
             endpoints = []
             for ep in response.endpoints:
                 # Include running and loaded endpoints
                 if ep.state.lower() in ["running", "loaded"]:
+                    if not ep.url:
+                        logger.warning("Skipping endpoint %s (no URL)", ep.name)
+                        continue
+
                     endpoint_info = EndpointInfo(
                         name=ep.name,
                         namespace=ep.namespace,
                         url=ep.url,
                         state=ep.state,
                         api_standard=ep.api_standard,
-                        task=ep.task,
+                        task=(ep.task or "").upper(),
                         model_name=ep.model_name,
                         has_chat_template=ep.has_chat_template,
+                        base_url=ep.url.rsplit('/', 2)[0],
                     )
                     endpoints.append(endpoint_info)
-                    logger.info(f"Found endpoint: {ep.name} (task: {ep.task}, state: {ep.state})")
+                    logger.info("Found endpoint: %s (task: %s, state: %s)", ep.name, ep.task, ep.state)
                 else:
-                    logger.debug(f"Skipping endpoint {ep.name} (state: {ep.state})")
+                    logger.debug("Skipping endpoint %s (state: %s)", ep.name, ep.state)
 
-            logger.info(f"Discovered {len(endpoints)} running endpoints")
+            logger.info("Discovered %s running endpoints", len(endpoints))
             return endpoints
 
         except Exception as e:
-            logger.error(f"Failed to discover endpoints: {e}")
-            return []
+            logger.error("Failed to discover endpoints in namespace %s: %s", namespace, e)
+            return None
+
+    def _discover_namespaces(self, namespaces: List[str]) -> List[Optional[List[EndpointInfo]]]:
+        """
+        Run discover_endpoints for each namespace in parallel
+
+        caiiclient is synchronous, so each namespace is queried from a worker
+        thread. A single namespace is queried directly.
+
+        Args:
+            namespaces: Kubernetes namespaces to query
+
+        Returns:
+            discover_endpoints result for each namespace, in the same order
+        """
+        if len(namespaces) == 1:
+            return [self.discover_endpoints(namespaces[0])]
+
+        max_workers = min(self.MAX_DISCOVERY_WORKERS, len(namespaces))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.discover_endpoints, namespaces))
+
+    def discover_all_endpoints(self, namespaces: Union[str, List[str]]) -> List[EndpointInfo]:
+        """
+        Discover endpoints in several namespaces in parallel
+
+        Args:
+            namespaces: Kubernetes namespace or list of namespaces to query
+
+        Returns:
+            List of EndpointInfo objects from all namespaces that could be queried
+        """
+        if isinstance(namespaces, str):
+            namespaces = [namespaces]
+
+        results = self._discover_namespaces(namespaces)
+        return [endpoint for endpoints in results if endpoints for endpoint in endpoints]
 
-    def generate_traffic_for_endpoint(self, endpoint: EndpointInfo) -> bool:
+    async def generate_traffic_for_endpoint(self, endpoint: EndpointInfo) -> bool:
         """
         Generate appropriate traffic for an endpoint based on its type
 
@@ -201,315 +390,505 @@ class TrafficGenerator:
         Returns:
             True if request was successful, False otherwise
         """
-        logger.info(f"Generating traffic for {endpoint.name} (task: {endpoint.task})")
+        logger.info("Generating traffic for %s (task: %s)", endpoint.name, endpoint.task)
 
         try:
-            task = endpoint.task.upper()
-
-            if task in ["TEXT_GENERATION", "TEXT_TO_TEXT_GENERATION"]:
-                return self._generate_text_traffic(endpoint)
-            elif task == "EMBED":
-                return self._generate_embedding_traffic(endpoint)
-            elif task == "RANK":
-                return self._generate_rerank_traffic(endpoint)
-            elif task == "IMAGE_TEXT_TO_TEXT":
-                return self._generate_vlm_traffic(endpoint)
-            elif task == "OBJECT_DETECTION":
-                # OBJECT_DETECTION endpoints may use chat completions format
-                return self._generate_vlm_traffic(endpoint)
-            elif task == "SPEECH_TO_TEXT":
-                logger.info(f"Skipping SPEECH_TO_TEXT endpoint {endpoint.name} (requires audio file)")
-                return True
-            elif task == "TEXT_TO_SPEECH":
-                logger.info(f"Skipping TEXT_TO_SPEECH endpoint {endpoint.name} (requires specific setup)")
-                return True
-            elif task == "INFERENCE":
-                # Generic INFERENCE endpoints - skip as format is unknown
-                logger.info(f"Skipping INFERENCE endpoint {endpoint.name} (generic inference format)")
+            task = endpoint.task
+
+            method_name = self._TASK_DISPATCH.get(task)
+            if method_name is not None:
+                return await getattr(self, method_name)(endpoint)
+
+            skip_reason = self._TASK_SKIP.get(task)
+            if skip_reason is not None:
+                logger.info("Skipping %s endpoint %s (%s)", task, endpoint.name, skip_reason)
                 return True
-            else:
-                logger.warning(f"Unknown task type {task} for endpoint {endpoint.name}")
-                return False
+
+            logger.warning("Unknown task type %s for endpoint %s", task, endpoint.name)
+            return False
 
         except Exception as e:
-            logger.error(f"Failed to generate traffic for {endpoint.name}: {e}")
+            logger.error("Failed to generate traffic for %s: %s", endpoint.name, e)
             return False
 
-    def _generate_text_traffic(self, endpoint: EndpointInfo) -> bool:
+    async def _generate_text_traffic(self, endpoint: EndpointInfo) -> bool:
         """Generate traffic for text generation models"""
         try:
             # Use OpenAI client for cleaner implementation
-            client = OpenAI(
-                base_url=endpoint.url.rsplit('/', 2)[0],  # Remove the /v1/... part
-                api_key=self.cdp_token,
-                http_client=self.http_client,
-            )
+            client = self._get_openai_client(endpoint.base_url)
 
             if endpoint.has_chat_template:
                 # Use chat completions
-                messages = random.choice(self.CHAT_PROMPTS)
-                logger.debug(f"Sending chat request to {endpoint.name}")
+                messages = self._rng.choice(self.CHAT_PROMPTS)
+                logger.debug("Sending chat request to %s", endpoint.name)
 
-                response = client.chat.completions.create(
+                response = await client.chat.completions.create(
                     model=endpoint.model_name,
                     messages=messages,
-                    max_tokens=self.max_tokens,
+                    max_tokens=self._completion_max_tokens,
                     temperature=0.7,
                 )
 
-                logger.info(f"✓ Chat completion successful for {endpoint.name}")
-                if response.choices and response.choices[0].message.content:
-                    logger.debug(f"Response: {response.choices[0].message.content[:100]}...")
+                logger.info("✓ Chat completion successful for %s", endpoint.name)
+                if not self.keepalive_mode and response.choices and response.choices[0].message.content:
+                    logger.debug("Response: %s...", response.choices[0].message.content[:100])
                 
             else:
                 # Use regular completions
-                prompt = random.choice(self.TEXT_GENERATION_PROMPTS)
-                logger.debug(f"Sending completion request to {endpoint.name}")
+                prompt = self._rng.choice(self.TEXT_GENERATION_PROMPTS)
+                logger.debug("Sending completion request to %s", endpoint.name)
 
-                response = client.completions.create(
+                response = await client.completions.create(
                     model=endpoint.model_name,
                     prompt=prompt,
-                    max_tokens=self.max_tokens,
+                    max_tokens=self._completion_max_tokens,
                     temperature=0.7,
                 )
                 
-                logger.info(f"✓ Completion successful for {endpoint.name}")
-                if response.choices and response.choices[0].text:
-                    logger.debug(f"Response: {response.choices[0].text[:100]}...")
+                logger.info("✓ Completion successful for %s", endpoint.name)
+                if not self.keepalive_mode and response.choices and response.choices[0].text:
+                    logger.debug("Response: %s...", response.choices[0].text[:100])
 
             return True
 
         except Exception as e:
-            logger.error(f"Text generation failed for {endpoint.name}: {e}")
+            logger.error("Text generation failed for %s: %s", endpoint.name, e)
             return False
 
-    def _generate_embedding_traffic(self, endpoint: EndpointInfo) -> bool:
+    async def _post_json(self, url: str, content: bytes,
+                         discard_body: bool = False) -> httpx.Response:
+        """
+        POST a serialized JSON body with the auth headers
+
+        With discard_body a successful response body is streamed and dropped
+        without being decoded. It is still drained so the connection can go
+        back to the pool. Error bodies are always read so they can be logged.
+
+        Args:
+            url: Endpoint URL
+            content: Serialized JSON request body
+            discard_body: Drop the body of a successful response unread
+
+        Returns:
+            The httpx response
+        """
+        if not discard_body:
+            return await self.http_client.post(url, content=content, headers=self._json_headers)
+
+        async with self.http_client.stream("POST", url, content=content,
+                                           headers=self._json_headers) as response:
+            if response.status_code == 200:
+                async for _ in response.aiter_bytes():
+                    pass
+            else:
+                await response.aread()
+        return response
+
+    def _get_embedding_payload(self, model_name: str) -> bytes:
+        """Return the serialized embedding request body for a model, batching all sample texts"""
+        payload = self._embedding_payloads.get(model_name)
+        if payload is None:
+            # Some models require input_type for asymmetric embeddings,
+            # use "query" as default
+            payload = orjson.dumps({
+                "model": model_name,
+                "input": self.EMBEDDING_TEXTS,
+                "input_type": "query",
+            })
+            self._embedding_payloads[model_name] = payload
+        return payload
+
+    def _get_rerank_payloads(self, model_name: str, rerank_format: str) -> List[bytes]:
+        """Return serialized rerank request bodies for a model and format, one per sample query"""
+        key = (model_name, rerank_format)
+        payloads = self._rerank_payloads.get(key)
+        if payloads is None:
+            payloads = [
+                orjson.dumps(self._build_rerank_payload(rerank_format, model_name, sample))
+                for sample in self.RERANK_QUERIES
+            ]
+            self._rerank_payloads[key] = payloads
+        return payloads
+
+    async def _generate_embedding_traffic(self, endpoint: EndpointInfo) -> bool:
         """Generate traffic for embedding models"""
         try:
             # The endpoint.url already includes the full path including /v1/embeddings
             # We need to make a direct HTTP request instead of using OpenAI client
             # which would add /v1/embeddings again
             
-            text = random.choice(self.EMBEDDING_TEXTS)
-            logger.debug(f"Sending embedding request to {endpoint.name}")
-            
-            # Build payload - some models require input_type for asymmetric embeddings
-            payload = {
-                "model": endpoint.model_name,
-                "input": text,
-                "input_type": "query",  # Use "query" as default for asymmetric models
-            }
-            
-            headers = {
-                "Authorization": f"Bearer {self.cdp_token}",
-                "Content-Type": "application/json",
-            }
+            # Send all sample texts as one batched request
+            payload = self._get_embedding_payload(endpoint.model_name)
+            logger.debug("Sending embedding request to %s", endpoint.name)
             
-            response = self.http_client.post(
-                endpoint.url,
-                json=payload,
-                headers=headers,
-            )
+            # The response is only inspected once per endpoint to learn the
+            # embedding dimension, later cycles just check the status
+            embedding_dim = self._embedding_dims.get(endpoint.url)
+            discard_body = self.keepalive_mode or embedding_dim is not None
+
+            response = await self._post_json(endpoint.url, payload, discard_body=discard_body)
             
             if response.status_code == 200:
-                result = response.json()
+                if embedding_dim is not None:
+                    logger.info("✓ Embedding successful for %s (dim: %s)", endpoint.name, embedding_dim)
+                    return True
+                if self.keepalive_mode:
+                    logger.info("✓ Embedding successful for %s", endpoint.name)
+                    return True
+
+                result = orjson.loads(response.content)
                 if 'data' in result and len(result['data']) > 0:
+                    if len(result['data']) != len(self.EMBEDDING_TEXTS):
+                        logger.warning(
+                            "Expected %s embeddings from %s, got %s",
+                            len(self.EMBEDDING_TEXTS), endpoint.name, len(result['data']),
+                        )
                     embedding_dim = len(result['data'][0]['embedding'])
-                    logger.info(f"✓ Embedding successful for {endpoint.name} (dim: {embedding_dim})")
+                    self._embedding_dims[endpoint.url] = embedding_dim
+                    logger.info("✓ Embedding successful for %s (dim: %s)", endpoint.name, embedding_dim)
                 else:
-                    logger.info(f"✓ Embedding successful for {endpoint.name}")
+                    logger.info("✓ Embedding successful for %s", endpoint.name)
                 return True
             else:
-                logger.error(f"Embedding request failed with status {response.status_code}: {response.text}")
+                logger.error("Embedding request failed with status %s: %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            logger.error(f"Embedding generation failed for {endpoint.name}: {e}")
+            logger.error("Embedding generation failed for %s: %s", endpoint.name, e)
             return False
 
-    def _generate_rerank_traffic(self, endpoint: EndpointInfo) -> bool:
-        """Generate traffic for reranking models"""
-        try:
-            sample = random.choice(self.RERANK_QUERIES)
-
-            # Reranking endpoints may use different formats
-            # Try the NIM format first
-            payload = {
-                "model": endpoint.model_name,
+    @staticmethod
+    def _build_rerank_payload(rerank_format: str, model_name: str,
+                              sample: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a rerank request body in the NIM or OpenAI-like format"""
+        if rerank_format == "nim":
+            return {
+                "model": model_name,
                 "query": {"text": sample["query"]},
                 "passages": [{"text": doc} for doc in sample["documents"]],
             }
+        return {
+            "model": model_name,
+            "query": sample["query"],
+            "documents": sample["documents"],
+        }
 
-            headers = {
-                "Authorization": f"Bearer {self.cdp_token}",
-                "Content-Type": "application/json",
-            }
+    async def _generate_rerank_traffic(self, endpoint: EndpointInfo) -> bool:
+        """Generate traffic for reranking models"""
+        try:
+            sample_index = self._rng.randrange(len(self.RERANK_QUERIES))
 
-            logger.debug(f"Sending rerank request to {endpoint.name}")
+            # Reranking endpoints may use different formats. Try the one that
+            # worked last time for this endpoint first (NIM by default)
+            preferred = self._rerank_format_cache.get(endpoint.url, "nim")
+            formats = [preferred] + [f for f in self.RERANK_FORMATS if f != preferred]
 
-            response = self.http_client.post(
-                endpoint.url,
-                json=payload,
-                headers=headers,
-            )
+            logger.debug("Sending rerank request to %s", endpoint.name)
 
-            if response.status_code == 200:
-                logger.info(f"✓ Reranking successful for {endpoint.name}")
-                return True
-            else:
-                # Try alternative format (OpenAI-like)
-                alt_payload = {
-                    "model": endpoint.model_name,
-                    "query": sample["query"],
-                    "documents": sample["documents"],
-                }
+            for attempt, rerank_format in enumerate(formats):
+                payloads = self._get_rerank_payloads(endpoint.model_name, rerank_format)
 
-                response = self.http_client.post(
-                    endpoint.url,
-                    json=alt_payload,
-                    headers=headers,
-                )
+                # The first attempt was already spaced out before dispatch
+                if attempt > 0:
+                    await self._wait_for_host(urlsplit(endpoint.url).netloc)
+
+                response = await self._post_json(endpoint.url, payloads[sample_index],
+                                                 discard_body=self.keepalive_mode)
 
                 if response.status_code == 200:
-                    logger.info(f"✓ Reranking successful for {endpoint.name} (alt format)")
+                    self._rerank_format_cache[endpoint.url] = rerank_format
+                    if rerank_format == "nim":
+                        logger.info("✓ Reranking successful for %s", endpoint.name)
+                    else:
+                        logger.info("✓ Reranking successful for %s (alt format)", endpoint.name)
                     return True
-                else:
-                    logger.error(f"Reranking failed with status {response.status_code}: {response.text}")
-                    return False
+
+            self._rerank_format_cache.pop(endpoint.url, None)
+            logger.error("Reranking failed with status %s: %s", response.status_code, response.text)
+            return False
 
         except Exception as e:
-            logger.error(f"Reranking failed for {endpoint.name}: {e}")
+            logger.error("Reranking failed for %s: %s", endpoint.name, e)
             return False
 
-    def _generate_vlm_traffic(self, endpoint: EndpointInfo) -> bool:
+    async def _generate_vlm_traffic(self, endpoint: EndpointInfo) -> bool:
         """Generate traffic for vision-language models"""
         try:
-            client = OpenAI(
-                base_url=endpoint.url.rsplit('/', 2)[0],
-                api_key=self.cdp_token,
-                http_client=self.http_client,
-            )
+            client = self._get_openai_client(endpoint.base_url)
             
             # Check if this is a nemoretriever-parse model (document parsing)
             is_parse_model = 'parse' in endpoint.model_name.lower()
             
             if is_parse_model:
                 # For nemoretriever-parse, send image-only content (no text prompt)
-                messages = [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{self.PLACEHOLDER_IMAGE}"
-                                }
-                            }
-                        ]
-                    }
-                ]
+                messages = self._vlm_parse_messages
             else:
                 # For regular VLMs, send both image and text
-                prompt = random.choice(self.VLM_PROMPTS)
-                messages = [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{self.PLACEHOLDER_IMAGE}"
-                                }
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ]
+                prompt = self._rng.choice(self.VLM_PROMPTS)
+                messages = self._vlm_messages[prompt]
             
-            logger.debug(f"Sending VLM request to {endpoint.name}")
+            logger.debug("Sending VLM request to %s", endpoint.name)
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=endpoint.model_name,
                 messages=messages,
-                max_tokens=self.max_tokens,
+                max_tokens=self._completion_max_tokens,
             )
             
-            logger.info(f"✓ VLM completion successful for {endpoint.name}")
-            if response.choices and response.choices[0].message.content:
-                logger.debug(f"Response: {response.choices[0].message.content[:100]}...")
+            logger.info("✓ VLM completion successful for %s", endpoint.name)
+            if not self.keepalive_mode and response.choices and response.choices[0].message.content:
+                logger.debug("Response: %s...", response.choices[0].message.content[:100])
             
             return True
             
         except Exception as e:
-            logger.error(f"VLM generation failed for {endpoint.name}: {e}")
+            logger.error("VLM generation failed for %s: %s", endpoint.name, e)
             return False
 
-    def run_continuous(self, namespace: str = "serving-default"):
+    def get_endpoints(self, namespaces: Union[str, List[str]] = "serving-default") -> List[EndpointInfo]:
+        """
+        Return running endpoints, rediscovering them once the cache expires
+
+        Each namespace is cached separately. When discovery of a namespace
+        fails, its previous endpoints (if any) are kept and it is retried on
+        the next call.
+
+        Args:
+            namespaces: Kubernetes namespace or list of namespaces to query
+
+        Returns:
+            List of EndpointInfo objects
+        """
+        if isinstance(namespaces, str):
+            namespaces = [namespaces]
+
+        now = time.monotonic()
+        stale = [
+            namespace for namespace in namespaces
+            if namespace not in self._discovery_cache
+            or now - self._discovery_cache[namespace][0] >= self.discovery_ttl
+        ]
+
+        if stale:
+            for namespace, endpoints in zip(stale, self._discover_namespaces(stale)):
+                if endpoints is not None:
+                    self._discovery_cache[namespace] = (now, endpoints)
+        else:
+            logger.debug("Using cached discovery results")
+
+        return [
+            endpoint
+            for namespace in namespaces
+            for endpoint in self._discovery_cache.get(namespace, (now, []))[1]
+        ]
+
+    def invalidate_discovery_cache(self):
+        """Force the next get_endpoints() call to rediscover endpoints"""
+        # Mark entries as expired rather than dropping them, so a namespace
+        # whose rediscovery fails still keeps its previous endpoints
+        self._discovery_cache = {
+            namespace: (float("-inf"), endpoints)
+            for namespace, (_, endpoints) in self._discovery_cache.items()
+        }
+
+    def _record_results(self, endpoints: List[EndpointInfo], results: List[bool]):
+        """
+        Track consecutive failures and drop the discovery cache when an endpoint keeps failing
+
+        The cache is dropped once per failure streak. An endpoint that is
+        still listed after the refresh and keeps failing does not force
+        further refreshes until it has succeeded again.
+        """
+        for endpoint, success in zip(endpoints, results):
+            # Tasks we don't send traffic to can't tell us anything about the endpoint
+            if endpoint.task not in self._TASK_DISPATCH:
+                continue
+
+            if success:
+                self._endpoint_failures.pop(endpoint.url, None)
+                continue
+
+            failures = self._endpoint_failures.get(endpoint.url, 0) + 1
+            self._endpoint_failures[endpoint.url] = failures
+            if failures == self.DISCOVERY_INVALIDATE_FAILURES:
+                logger.info("%s failed %s times in a row, refreshing endpoint list", endpoint.name, failures)
+                self.invalidate_discovery_cache()
+
+    async def _warmup_host(self, host_url: str):
+        """Open a pooled connection to a host; failures are logged and ignored"""
+        try:
+            await self.http_client.get(host_url, timeout=5.0)
+            logger.debug("Warmed up connection to %s", host_url)
+        except Exception as e:
+            logger.warning("Warmup request to %s failed: %s", host_url, e)
+
+    async def warmup(self, namespaces: Union[str, List[str]] = "serving-default"):
+        """
+        Discover endpoints and open a connection to each serving host
+
+        This moves the TCP and TLS handshakes out of the first traffic cycle
+        and primes the discovery cache.
+
+        Args:
+            namespaces: Kubernetes namespace or list of namespaces to query
+        """
+        endpoints = self.get_endpoints(namespaces)
+
+        host_urls = set()
+        for endpoint in endpoints:
+            parts = urlsplit(endpoint.url)
+            host_urls.add(f"{parts.scheme}://{parts.netloc}/")
+
+        if not host_urls:
+            return
+
+        logger.info("Warming up connections to %s host(s)", len(host_urls))
+        await asyncio.gather(*[self._warmup_host(url) for url in host_urls])
+
+    async def _wait_for_host(self, host: str):
+        """Wait until HOST_MIN_GAP seconds have passed since the last request to a host"""
+        lock = self._host_locks.get(host)
+        if lock is None:
+            lock = self._host_locks[host] = asyncio.Lock()
+
+        async with lock:
+            last_send = self._host_last_send.get(host)
+            if last_send is not None:
+                delay = last_send + self.HOST_MIN_GAP - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self._host_last_send[host] = time.monotonic()
+
+    async def _generate_traffic_for_endpoint_limited(self, semaphore: asyncio.Semaphore,
+                                                     endpoint: EndpointInfo) -> bool:
+        """Generate traffic for an endpoint once its host and a concurrency slot are free"""
+        # Space out requests to the same host so it isn't overwhelmed;
+        # different hosts proceed in parallel. Skipped and unknown tasks send
+        # nothing, so they don't use up the host's gap
+        if endpoint.task in self._TASK_DISPATCH:
+            await self._wait_for_host(urlsplit(endpoint.url).netloc)
+        async with semaphore:
+            return await self.generate_traffic_for_endpoint(endpoint)
+
+    async def generate_traffic_for_endpoints(self, endpoints: List[EndpointInfo]) -> List[bool]:
+        """
+        Generate traffic for all endpoints concurrently
+
+        Args:
+            endpoints: List of EndpointInfo objects
+
+        Returns:
+            Success flag for each endpoint, in the same order
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return await asyncio.gather(*[
+            self._generate_traffic_for_endpoint_limited(semaphore, endpoint)
+            for endpoint in endpoints
+        ])
+
+    def run_continuous(self, namespaces: Union[str, List[str]] = "serving-default"):
         """
         Continuously discover and generate traffic for endpoints
 
         Args:
-            namespace: Kubernetes namespace to monitor
+            namespaces: Kubernetes namespace or list of namespaces to monitor
         """
+        try:
+            run_event_loop(self._run_continuous_async(namespaces))
+        except KeyboardInterrupt:
+            logger.info("Received interrupt signal, shutting down...")
+
+    async def _run_continuous_async(self, namespaces: Union[str, List[str]]):
+        """Event loop body of run_continuous"""
         logger.info("Starting continuous traffic generation")
-        logger.info(f"Interval: {self.interval} seconds")
-        logger.info(f"Namespace: {namespace}")
+        logger.info("Interval: %s seconds", self.interval)
+        if isinstance(namespaces, str):
+            namespaces = [namespaces]
+        logger.info("Namespaces: %s", ", ".join(namespaces))
 
-        while True:
-            try:
-                # Discover endpoints
-                endpoints = self.discover_endpoints(namespace)
+        try:
+            await self.warmup(namespaces)
 
-                if not endpoints:
-                    logger.warning("No running endpoints found")
-                else:
-                    # Generate traffic for each endpoint
-                    success_count = 0
-                    for endpoint in endpoints:
-                        if self.generate_traffic_for_endpoint(endpoint):
-                            success_count += 1
-                        # Small delay between requests to avoid overwhelming the system
-                        time.sleep(2)
-
-                    logger.info(f"Traffic generation cycle complete: {success_count}/{len(endpoints)} successful")
-
-                # Wait before next cycle
-                logger.info(f"Waiting {self.interval} seconds before next cycle...")
-                time.sleep(self.interval)
-
-            except KeyboardInterrupt:
-                logger.info("Received interrupt signal, shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"Error in traffic generation cycle: {e}")
-                logger.info(f"Waiting {self.interval} seconds before retry...")
-                time.sleep(self.interval)
-
-    def run_once(self, namespace: str = "serving-default"):
+            # Cycles start on a fixed grid of interval seconds, so time spent
+            # generating traffic is taken out of the wait instead of added to it
+            next_deadline = time.monotonic() + self.interval
+
+            while True:
+                try:
+                    await self._cycle(namespaces)
+
+                    # Wait before next cycle
+                    next_deadline = await self._sleep_until(next_deadline, "next cycle")
+
+                except Exception as e:
+                    logger.error("Error in traffic generation cycle: %s", e)
+                    next_deadline = await self._sleep_until(next_deadline, "retry")
+        finally:
+            await self.http_client.aclose()
+
+    async def _cycle(self, namespaces: List[str]):
+        """Run one continuous-mode traffic generation cycle"""
+        # Discover endpoints (cached between cycles)
+        endpoints = self.get_endpoints(namespaces)
+
+        if not endpoints:
+            logger.warning("No running endpoints found")
+            return
+
+        # Generate traffic for all endpoints concurrently
+        results = await self.generate_traffic_for_endpoints(endpoints)
+        self._record_results(endpoints, results)
+        success_count = sum(results)
+        logger.info("Traffic generation cycle complete: %s/%s successful", success_count, len(endpoints))
+
+    async def _sleep_until(self, deadline: float, reason: str) -> float:
+        """
+        Sleep until a monotonic deadline and return the following one
+
+        Deadlines missed because a cycle overran are skipped rather than run
+        back to back.
+
+        Args:
+            deadline: time.monotonic() value at which the next cycle starts
+            reason: What the wait is for, used in the log message
+
+        Returns:
+            Deadline of the cycle after the one being waited for
+        """
+        now = time.monotonic()
+        if deadline <= now and self.interval > 0:
+            deadline += ((now - deadline) // self.interval + 1) * self.interval
+
+        sleep_for = max(0.0, deadline - now)
+        logger.info("Waiting %.1f seconds before %s...", sleep_for, reason)
+        await asyncio.sleep(sleep_for)
+        return deadline + self.interval
+
+    def run_once(self, namespaces: Union[str, List[str]] = "serving-default"):
         """
         Run a single traffic generation cycle
 
         Args:
-            namespace: Kubernetes namespace to query
+            namespaces: Kubernetes namespace or list of namespaces to query
         """
+        run_event_loop(self._run_once_async(namespaces))
+
+    async def _run_once_async(self, namespaces: Union[str, List[str]]):
+        """Event loop body of run_once"""
         logger.info("Running single traffic generation cycle")
 
-        endpoints = self.discover_endpoints(namespace)
+        try:
+            endpoints = self.discover_all_endpoints(namespaces)
 
-        if not endpoints:
-            logger.warning("No running endpoints found")
-            return
+            if not endpoints:
+                logger.warning("No running endpoints found")
+                return
 
-        success_count = 0
-        for endpoint in endpoints:
-            if self.generate_traffic_for_endpoint(endpoint):
-                success_count += 1
-            time.sleep(2)
+            success_count = sum(await self.generate_traffic_for_endpoints(endpoints))
 
-        logger.info(f"Cycle complete: {success_count}/{len(endpoints)} successful")
+            logger.info("Cycle complete: %s/%s successful", success_count, len(endpoints))
+        finally:
+            await self.http_client.aclose()
 
 
 def main():
@@ -528,6 +907,9 @@ Examples:
   # Custom interval and namespace
   %(prog)s --token $CDP_TOKEN --domain your-domain.com --interval 120 --namespace custom-ns
 
+  # Multiple namespaces
+  %(prog)s --token $CDP_TOKEN --domain your-domain.com --namespace ns-a ns-b
+
   # Use environment variables
   export CDP_TOKEN=your-token
   export CML_DOMAIN=your-domain.com
@@ -549,8 +931,9 @@ Examples:
 
     parser.add_argument(
         "--namespace",
-        default="serving-default",
-        help="Kubernetes namespace to monitor (default: serving-default)"
+        nargs="+",
+        default=["serving-default"],
+        help="Kubernetes namespace(s) to monitor (default: serving-default)"
     )
 
     parser.add_argument(
@@ -567,6 +950,12 @@ Examples:
         help="Maximum tokens for text generation (default: 50)"
     )
 
+    parser.add_argument(
+        "--keepalive-mode",
+        action="store_true",
+        help="Request a single token and discard response bodies (minimal traffic)"
+    )
+
     parser.add_argument(
         "--no-verify-ssl",
         action="store_true",
@@ -605,13 +994,14 @@ Examples:
         verify_ssl=not args.no_verify_ssl,
         interval=args.interval,
         max_tokens=args.max_tokens,
+        keepalive_mode=args.keepalive_mode,
     )
 
     # Run
     if args.once:
-        generator.run_once(namespace=args.namespace)
+        generator.run_once(namespaces=args.namespace)
     else:
-        generator.run_continuous(namespace=args.namespace)
+        generator.run_continuous(namespaces=args.namespace)
 
 
 if __name__ == "__main__":